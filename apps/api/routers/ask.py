@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import time
-from typing import List
+from typing import AsyncIterator, Dict, List
 
+import orjson
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
 from apps.api.middleware import get_current_user
 from apps.api.models import AnswerCitation, AskRequest, AskResponse, TokenPayload
 from apps.api.rate_limit import limiter
 from apps.api.services import LLMService, RetrievalOrchestrator
+from apps.api.services.retrieval import RetrievedDocument
 
 router = APIRouter(prefix="/ask", tags=["ask"])
 
@@ -16,15 +19,39 @@ retrieval_service = RetrievalOrchestrator()
 llm_service = LLMService()
 
 
+def _citations(documents: List[RetrievedDocument]) -> List[AnswerCitation]:
+    return [AnswerCitation(source_uri=doc.uri, snippet=doc.text[:200], score=doc.score) for doc in documents]
+
+
+def _sse(data: Dict[str, object]) -> bytes:
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
 @router.post("", response_model=AskResponse)
 @limiter.limit("60/minute")
 async def ask_endpoint(request: Request, payload: AskRequest, _: TokenPayload = Depends(get_current_user)) -> AskResponse:
     start = time.perf_counter()
     documents = await retrieval_service.retrieve(payload.query, top_k=payload.top_k)
     answer_text = await llm_service.generate(payload.query, [doc.__dict__ for doc in documents], stream=False)
-    citations: List[AnswerCitation] = [
-        AnswerCitation(source_uri=doc.uri, snippet=doc.text[:200], score=doc.score)
-        for doc in documents
-    ]
+    citations = _citations(documents)
     latency_ms = int((time.perf_counter() - start) * 1000)
     return AskResponse(answer=answer_text, citations=citations, latency_ms=latency_ms)
+
+
+@router.post("/stream")
+@limiter.limit("60/minute")
+async def ask_stream_endpoint(
+    request: Request, payload: AskRequest, _: TokenPayload = Depends(get_current_user)
+) -> StreamingResponse:
+    start = time.perf_counter()
+    documents = await retrieval_service.retrieve(payload.query, top_k=payload.top_k)
+
+    # Server-sent events: one {"token"} event per LLM chunk, then a final {"citations", "latency_ms"} event.
+    async def events() -> AsyncIterator[bytes]:
+        async for token in llm_service.stream(payload.query, [doc.__dict__ for doc in documents]):
+            yield _sse({"token": token})
+        latency_ms = int((time.perf_counter() - start) * 1000)
+        citations = [citation.model_dump() for citation in _citations(documents)]
+        yield _sse({"citations": citations, "latency_ms": latency_ms})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
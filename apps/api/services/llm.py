@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 import httpx
+import orjson
 
 from core.config import settings
 from core.logging import log_event
@@ -16,16 +17,10 @@ class LLMService:
         self._client = httpx.AsyncClient(base_url=settings.ollama_host, timeout=60.0)
         self._model = settings.llm_model
 
-    async def generate(
-        self,
-        query: str,
-        context_documents: List[Dict[str, Any]],
-        stream: bool = False,
-    ) -> str:
-        prompt = self._build_prompt(query, context_documents)
-        payload: Dict[str, object] = {
+    def _payload(self, query: str, context_documents: List[Dict[str, Any]], stream: bool) -> Dict[str, object]:
+        return {
             "model": self._model,
-            "prompt": prompt,
+            "prompt": self._build_prompt(query, context_documents),
             "options": {
                 "temperature": 0.2,
                 "top_p": 0.9,
@@ -33,19 +28,35 @@ class LLMService:
             },
             "stream": stream,
         }
+
+    async def generate(
+        self,
+        query: str,
+        context_documents: List[Dict[str, Any]],
+        stream: bool = False,
+    ) -> str:
         if stream:
-            async with self._client.stream("POST", "/api/generate", json=payload) as response:
-                response.raise_for_status()
-                chunks: List[str] = []
-                async for piece in response.aiter_text():
-                    chunks.append(piece)
-                return "".join(chunks)
-        response = await self._client.post("/api/generate", json=payload)
+            return "".join([piece async for piece in self.stream(query, context_documents)])
+        response = await self._client.post("/api/generate", json=self._payload(query, context_documents, stream=False))
         response.raise_for_status()
         data = response.json()
         log_event(logger, "llm.response", tokens=data.get("eval_count", 0))
         return data["response"]
 
+    async def stream(self, query: str, context_documents: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        payload = self._payload(query, context_documents, stream=True)
+        async with self._client.stream("POST", "/api/generate", json=payload) as response:
+            response.raise_for_status()
+            # Ollama streams one JSON object per line; each carries the next slice of the answer.
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    log_event(logger, "llm.response", tokens=data.get("eval_count", 0))
+
     def _build_prompt(self, query: str, documents: List[Dict[str, Any]]) -> str:
         context_sections = []
         for idx, doc in enumerate(documents, start=1):
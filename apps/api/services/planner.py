@@ -6,6 +6,13 @@ from typing import Dict, List
 
 import pendulum
 
+# Compiled once at import; these keep the original case-insensitive substring matching.
+_TEMPORAL_INTENT_RE = re.compile(r"when|schedule|calendar|date", re.IGNORECASE)
+_ENTITY_INTENT_RE = re.compile(r"who|person", re.IGNORECASE)
+_ANALYTICAL_INTENT_RE = re.compile(r"compare|analysis|why|how", re.IGNORECASE)
+_ENTITY_RE = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*")
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
 
 @dataclass
 class QueryPlan:
@@ -17,27 +24,27 @@ class QueryPlan:
 
 class QueryPlanner:
     TEMPORAL_KEYWORDS = {"when", "schedule", "date", "time", "timeline", "timeline"}
+    _TEMPORAL_KEYWORD_RE = re.compile("|".join(map(re.escape, sorted(TEMPORAL_KEYWORDS))), re.IGNORECASE)
 
     def classify_intent(self, query: str) -> str:
-        if any(word in query.lower() for word in ["when", "schedule", "calendar", "date"]):
+        if _TEMPORAL_INTENT_RE.search(query):
             return "temporal"
-        if "who" in query.lower() or "person" in query.lower():
+        if _ENTITY_INTENT_RE.search(query):
             return "entity"
-        if any(word in query.lower() for word in ["compare", "analysis", "why", "how"]):
+        if _ANALYTICAL_INTENT_RE.search(query):
             return "analytical"
         return "factual"
 
     def extract_entities(self, query: str) -> List[str]:
-        pattern = r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*"
-        return re.findall(pattern, query)
+        return _ENTITY_RE.findall(query)
 
     def extract_time_range(self, query: str) -> Dict[str, str] | None:
-        date_matches = re.findall(r"(\d{4}-\d{2}-\d{2})", query)
+        date_matches = _DATE_RE.findall(query)
         if date_matches:
             start = pendulum.parse(date_matches[0]).to_iso8601_string()
             end = pendulum.parse(date_matches[-1]).to_iso8601_string()
             return {"start": start, "end": end}
-        if any(keyword in query.lower() for keyword in self.TEMPORAL_KEYWORDS):
+        if self._TEMPORAL_KEYWORD_RE.search(query):
             now = pendulum.now()
             return {"start": now.subtract(months=1).to_iso8601_string(), "end": now.to_iso8601_string()}
         return None
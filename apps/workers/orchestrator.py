@@ -91,7 +91,11 @@ class WorkerOrchestrator:
         self._scheduler.start()
         for connector in self._connectors:
             asyncio.create_task(self._run_connector(connector))
-        await self._run_forever()
+        try:
+            await self._run_forever()
+        finally:
+            for connector in self._connectors:
+                await connector.aclose()
 
     def _schedule_connectors(self) -> None:
         for connector in self._connectors:
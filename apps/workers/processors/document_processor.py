@@ -291,6 +291,7 @@ class DocumentProcessor:
         image_embeddings: List[Dict[str, Any]],
     ) -> None:
         text_payload = []
+        block_vector_rows: List[Dict[str, Any]] = []
         texts = [block.text for block in block_vectors if block.text]
         if texts:
             vectors = await text_embedding_service.embed(texts)
@@ -309,7 +310,9 @@ class DocumentProcessor:
                         "mime_type": block.mime_type,
                     }
                 )
-                await self._graph.set_block_vector(block.block_id, vector)
+                block_vector_rows.append({"block_id": block.block_id, "vector": vector})
+        if block_vector_rows:
+            await self._graph.set_block_vectors(block_vector_rows)
         if text_payload:
             await self._vectors.upsert_vectors("documents", text_payload, primary_key="id")
         if image_embeddings:
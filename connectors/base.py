@@ -18,3 +18,6 @@ class BaseConnector(abc.ABC):
     @abc.abstractmethod
     async def checkpoint(self, state: Dict[str, Any]) -> None:
         """Persist connector state for incremental updates."""
+
+    async def aclose(self) -> None:
+        """Release network clients shared across sync runs."""
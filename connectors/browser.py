@@ -21,6 +21,7 @@ class BrowserHistoryConnector(BaseConnector):
         self._firefox_profile_dir = Path(settings.firefox_profile_path).expanduser()
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         state = await load_state(self.name)
         new_state: Dict[str, Any] = {}
 
@@ -28,7 +29,7 @@ class BrowserHistoryConnector(BaseConnector):
             last_ts = state.get("chrome_last_visit")
             chrome_entries, latest = self._read_chrome_history(last_ts)
             for entry in chrome_entries:
-                yield self._build_sync_result("chrome", entry)
+                yield self._build_sync_result("chrome", entry, now_iso)
             if latest:
                 new_state["chrome_last_visit"] = latest
 
@@ -36,7 +37,7 @@ class BrowserHistoryConnector(BaseConnector):
             last_ts = state.get("firefox_last_visit")
             firefox_entries, latest = self._read_firefox_history(last_ts)
             for entry in firefox_entries:
-                yield self._build_sync_result("firefox", entry)
+                yield self._build_sync_result("firefox", entry, now_iso)
             if latest:
                 new_state["firefox_last_visit"] = latest
 
@@ -100,7 +101,7 @@ class BrowserHistoryConnector(BaseConnector):
         temp_copy.unlink(missing_ok=True)
         return entries, latest
 
-    def _build_sync_result(self, browser: str, entry: Dict[str, Any]) -> SyncResult:
+    def _build_sync_result(self, browser: str, entry: Dict[str, Any], now_iso: str) -> SyncResult:
         doc_id = f"{browser}:{hash(entry['url'])}"
         document = {
             "doc_id": doc_id,
@@ -110,7 +111,7 @@ class BrowserHistoryConnector(BaseConnector):
             "created_at": entry["visited_at"],
             "valid_from": entry["visited_at"],
             "valid_to": None,
-            "system_from": datetime.now(timezone.utc).isoformat(),
+            "system_from": now_iso,
             "system_to": None,
         }
         block = {
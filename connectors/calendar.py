@@ -23,6 +23,7 @@ class GoogleCalendarConnector(BaseConnector):
         return await asyncio.to_thread(_build)
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         service = await self._service()
         state = await load_state(self.name)
         sync_token = state.get("sync_token")
@@ -59,7 +60,7 @@ class GoogleCalendarConnector(BaseConnector):
                     "created_at": event.get("created", datetime.now(timezone.utc).isoformat()),
                     "valid_from": start_iso,
                     "valid_to": end_iso,
-                    "system_from": datetime.now(timezone.utc).isoformat(),
+                    "system_from": now_iso,
                     "system_to": None,
                 }
                 attendees = [attendee.get("email") for attendee in event.get("attendees", []) if attendee.get("email")]
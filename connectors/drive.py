@@ -33,6 +33,7 @@ class DriveConnector(BaseConnector):
         return await asyncio.to_thread(_build)
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         service = await self._service()
         state = await load_state(self.name)
         page_token = state.get("start_page_token")
@@ -63,7 +64,7 @@ class DriveConnector(BaseConnector):
                     "created_at": metadata.get("createdTime"),
                     "valid_from": metadata.get("modifiedTime"),
                     "valid_to": None,
-                    "system_from": datetime.now(timezone.utc).isoformat(),
+                    "system_from": now_iso,
                     "system_to": None,
                 }
                 yield SyncResult(
@@ -89,6 +89,7 @@ class GmailConnector(BaseConnector):
         return await asyncio.to_thread(_build)
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         service = await self._service()
         state = await load_state(self.name)
         history_id = state.get("history_id")
@@ -143,7 +144,7 @@ class GmailConnector(BaseConnector):
                 "created_at": timestamp.isoformat(),
                 "valid_from": timestamp.isoformat(),
                 "valid_to": None,
-                "system_from": datetime.now(timezone.utc).isoformat(),
+                "system_from": now_iso,
                 "system_to": None,
             }
             email_node = {
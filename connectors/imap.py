@@ -30,6 +30,7 @@ class GenericIMAPConnector(BaseConnector):
         self._password = settings.generic_imap_password
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         state = await load_state(self.name)
         last_uid = state.get("last_uid", 0)
 
@@ -95,7 +96,7 @@ class GenericIMAPConnector(BaseConnector):
                 "created_at": sent.isoformat(),
                 "valid_from": sent.isoformat(),
                 "valid_to": None,
-                "system_from": datetime.now(timezone.utc).isoformat(),
+                "system_from": now_iso,
                 "system_to": None,
             }
             email_node = {
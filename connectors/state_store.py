@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from core.cache import valkey_client
 
@@ -12,3 +12,11 @@ async def load_state(connector_name: str) -> Dict[str, Any]:
 
 async def save_state(connector_name: str, state: Dict[str, Any]) -> None:
     await valkey_client.set(f"connector:{connector_name}:state", state)
+
+
+async def load_item(connector_name: str, item_id: str) -> Optional[Dict[str, Any]]:
+    return await valkey_client.get(f"connector:{connector_name}:item:{item_id}")
+
+
+async def save_item(connector_name: str, item_id: str, item: Dict[str, Any], ttl_seconds: int) -> None:
+    await valkey_client.set(f"connector:{connector_name}:item:{item_id}", item, ttl_seconds)
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict
+from typing import Any, AsyncIterator, Dict, List
 
 from connectors.base import BaseConnector, SyncResult
 from connectors.state_store import load_state, save_state
@@ -21,29 +20,38 @@ class GoogleTakeoutConnector(BaseConnector):
             raise RuntimeError(f"Google Takeout path not found: {self._base_path}")
 
     async def sync(self) -> AsyncIterator[SyncResult]:  # type: ignore[override]
+        now_iso = datetime.now(timezone.utc).isoformat()
         state = await load_state(self.name)
         known_hashes = state.get("hashes", {})
+        known_stats = state.get("stats", {})
         new_hashes: Dict[str, str] = {}
+        new_stats: Dict[str, List[int]] = {}
         for file_path in self._base_path.rglob("*.json"):
-            raw = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
-            sha = hashlib.sha256(raw.encode("utf-8")).hexdigest()
-            new_hashes[str(file_path)] = sha
-            if known_hashes.get(str(file_path)) == sha:
+            str_path = str(file_path)
+            stat_result = file_path.stat()
+            file_stat = [stat_result.st_size, stat_result.st_mtime_ns]
+            new_stats[str_path] = file_stat
+            if known_hashes.get(str_path) and known_stats.get(str_path) == file_stat:
+                new_hashes[str_path] = known_hashes[str_path]
+                continue
+            raw_bytes = await asyncio.to_thread(file_path.read_bytes)
+            sha = hashlib.sha256(raw_bytes).hexdigest()
+            new_hashes[str_path] = sha
+            if known_hashes.get(str_path) == sha:
                 continue
-            data = json.loads(raw)
             doc_id = f"takeout:{sha[:12]}"
             document = {
                 "doc_id": doc_id,
                 "version": sha,
                 "title": file_path.stem,
                 "source": "google_takeout",
-                "created_at": datetime.fromtimestamp(file_path.stat().st_ctime, tz=timezone.utc).isoformat(),
-                "valid_from": datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc).isoformat(),
+                "created_at": datetime.fromtimestamp(stat_result.st_ctime, tz=timezone.utc).isoformat(),
+                "valid_from": datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc).isoformat(),
                 "valid_to": None,
-                "system_from": datetime.now(timezone.utc).isoformat(),
+                "system_from": now_iso,
                 "system_to": None,
             }
-            block_content = json.dumps(data, indent=2)[:5000]
+            block_content = raw_bytes[:5000].decode("utf-8", "ignore")
             block = {
                 "block_id": doc_id,
                 "block_type": "json",
@@ -53,14 +61,14 @@ class GoogleTakeoutConnector(BaseConnector):
             }
             files = [
                 {
-                    "uri": str(file_path),
+                    "uri": str_path,
                     "mime_type": "application/json",
-                    "size_bytes": file_path.stat().st_size,
+                    "size_bytes": stat_result.st_size,
                     "created_at": document["created_at"],
                 }
             ]
             yield SyncResult({"document": document, "block": block, "files": files})
-        await save_state(self.name, {"hashes": new_hashes})
+        await save_state(self.name, {"hashes": new_hashes, "stats": new_stats})
 
     async def checkpoint(self, state: Dict[str, Any]) -> None:
         await save_state(self.name, state)
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, Callable, Coroutine, Iterable, Optional
 
+import orjson
 from redis.asyncio import Redis
 
 from core.config import settings
 from core.logging import log_event
+from core.metrics import CACHE_HITS, CACHE_MISSES, QUEUE_DEQUEUED, QUEUE_ENQUEUED
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +28,16 @@ class ValkeyClient:
     async def get(self, key: str) -> Optional[Any]:
         value = await self._client.get(key)
         if value:
-            log_event(logger, "cache.hit", key=key)
+            CACHE_HITS.inc()
+            log_event(logger, "cache.hit", level=logging.DEBUG, key=key)
             return json.loads(value)
-        log_event(logger, "cache.miss", key=key)
+        CACHE_MISSES.inc()
+        log_event(logger, "cache.miss", level=logging.DEBUG, key=key)
         return None
 
     async def set(self, key: str, value: Any, ttl_seconds: int = 86400) -> None:
         await self._client.set(key, json.dumps(value), ex=ttl_seconds)
-        log_event(logger, "cache.store", key=key)
+        log_event(logger, "cache.store", level=logging.DEBUG, key=key)
 
     async def cached(self, key: str, ttl_seconds: int, loader: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
         data = await self.get(key)
@@ -44,14 +48,23 @@ class ValkeyClient:
         return data
 
     async def enqueue(self, queue: str, payload: Any) -> None:
-        await self._client.lpush(queue, json.dumps(payload))
-        log_event(logger, "queue.enqueue", queue=queue)
+        await self._client.lpush(queue, orjson.dumps(payload))
+        QUEUE_ENQUEUED.labels(queue).inc()
+
+    async def enqueue_many(self, queue: str, payloads: Iterable[Any]) -> None:
+        # One LPUSH with every blob keeps the FIFO order dequeue (BRPOP) sees, in a single round trip.
+        blobs = [orjson.dumps(payload) for payload in payloads]
+        if not blobs:
+            return
+        await self._client.lpush(queue, *blobs)
+        QUEUE_ENQUEUED.labels(queue).inc(len(blobs))
 
     async def dequeue(self, queue: str, timeout: int = 5) -> Optional[Any]:
         result = await self._client.brpop(queue, timeout=timeout)
         if result:
             _, data = result
-            return json.loads(data)
+            QUEUE_DEQUEUED.labels(queue).inc()
+            return orjson.loads(data)
         return None
 
     @property
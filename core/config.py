@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     minio_secret_key: str = Field(default="minioadmin")
     minio_secure: bool = Field(default=False)
     minio_bucket: str = Field(default="pkb-artifacts")
+    minio_io_concurrency: int = Field(default=16)
 
     lancedb_uri: str = Field(default="./data/lancedb")
 
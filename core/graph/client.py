@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import date, datetime
 from typing import Any, Dict, Iterable, List
 
-from neo4j import AsyncGraphDatabase, AsyncTransaction
+import orjson
+from neo4j import AsyncGraphDatabase, AsyncSession, AsyncTransaction
 
 from core.config import settings
 from core.logging import log_event
@@ -13,6 +15,28 @@ from .queries import GraphQueries
 logger = logging.getLogger(__name__)
 
 
+# Props applied with SET += only remove a property when sent as null, so these keep their explicit
+# None to reset the stored value; every other None is dropped.
+_NULLABLE_FIELDS = frozenset({"valid_to", "text_vector"})
+
+
+def _sanitize(props: Dict[str, Any]) -> Dict[str, Any]:
+    clean: Dict[str, Any] = {}
+    for key, value in props.items():
+        if value is None:
+            if key in _NULLABLE_FIELDS:
+                clean[key] = None
+            continue
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, dict):
+            value = orjson.dumps(value).decode()
+        elif isinstance(value, tuple):
+            value = list(value)
+        clean[key] = value
+    return clean
+
+
 class GraphService:
     def __init__(self) -> None:
         self._driver = AsyncGraphDatabase.driver(
@@ -25,6 +49,9 @@ class GraphService:
     async def close(self) -> None:
         await self._driver.close()
 
+    def session(self) -> AsyncSession:
+        return self._driver.session()
+
     async def ping(self) -> bool:
         async with self._driver.session() as session:
             result = await session.run("RETURN 1 AS alive")
@@ -34,117 +61,131 @@ class GraphService:
     async def _execute(self, query: str, parameters: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
         async with self._driver.session() as session:
             result = await session.run(query, parameters or {})
-            return [record.data() for record in await result.to_list()]
+            return [dict(record.items()) async for record in result]
 
     async def upsert_document(self, doc: Dict[str, Any]) -> None:
-        await self._execute(GraphQueries.upsert_document(), {"doc_id": doc["doc_id"], "props": doc})
+        await self._execute(GraphQueries.UPSERT_DOCUMENT, {"doc_id": doc["doc_id"], "props": doc})
 
     async def link_document_file(self, doc_id: str, sha256: str) -> None:
-        await self._execute(GraphQueries.link_document_file(), {"doc_id": doc_id, "sha256": sha256})
+        await self._execute(GraphQueries.LINK_DOCUMENT_FILE, {"doc_id": doc_id, "sha256": sha256})
 
     async def upsert_file(self, file_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_file(),
+            GraphQueries.UPSERT_FILE,
             {"sha256": file_props["sha256"], "props": file_props},
         )
 
     async def upsert_email(self, email_props: Dict[str, Any]) -> None:
-        await self._execute(GraphQueries.upsert_email(), {"message_id": email_props["message_id"], "props": email_props})
+        await self._execute(GraphQueries.UPSERT_EMAIL, {"message_id": email_props["message_id"], "props": email_props})
 
     async def upsert_person(self, person_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_person(),
+            GraphQueries.UPSERT_PERSON,
             {"person_id": person_props["person_id"], "props": person_props},
         )
 
     async def upsert_project(self, project_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_project(),
+            GraphQueries.UPSERT_PROJECT,
             {"project_id": project_props["project_id"], "props": project_props},
         )
 
     async def upsert_organization(self, org_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_organization(),
+            GraphQueries.UPSERT_ORGANIZATION,
             {"org_id": org_props["org_id"], "props": org_props},
         )
 
     async def upsert_place(self, place_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_place(),
+            GraphQueries.UPSERT_PLACE,
             {"place_id": place_props["place_id"], "props": place_props},
         )
 
     async def upsert_event(self, event_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_event(),
+            GraphQueries.UPSERT_EVENT,
             {"event_id": event_props["event_id"], "props": event_props},
         )
 
     async def upsert_image(self, image_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_image(),
+            GraphQueries.UPSERT_IMAGE,
             {"image_id": image_props["image_id"], "props": image_props},
         )
 
     async def upsert_audio(self, audio_props: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_audio(),
+            GraphQueries.UPSERT_AUDIO,
             {"audio_id": audio_props["audio_id"], "props": audio_props},
         )
 
     async def link_audio_transcript(self, audio_id: str, transcript_id: str) -> None:
         await self._execute(
-            GraphQueries.link_audio_transcript(),
+            GraphQueries.LINK_AUDIO_TRANSCRIPT,
             {"audio_id": audio_id, "transcript_id": transcript_id},
         )
 
     async def link_files_near_duplicate(self, source_sha: str, target_sha: str) -> None:
         await self._execute(
-            GraphQueries.link_files_near_duplicate(),
+            GraphQueries.LINK_FILES_NEAR_DUPLICATE,
             {"source_sha": source_sha, "target_sha": target_sha},
         )
 
     async def link_email_person(self, message_id: str, person_id: str, relation: str) -> None:
+        query = GraphQueries.LINK_EMAIL_PERSON.get(relation.upper())
+        if query is None:
+            raise ValueError(f"Unsupported email relation: {relation}")
         await self._execute(
-            GraphQueries.link_email_person(relation),
+            query,
             {"message_id": message_id, "person_id": person_id},
         )
 
     async def link_email_document(self, message_id: str, doc_id: str) -> None:
         await self._execute(
-            GraphQueries.link_email_document(),
+            GraphQueries.LINK_EMAIL_DOCUMENT,
             {"message_id": message_id, "doc_id": doc_id},
         )
 
     async def upsert_transcript(self, transcript: Dict[str, Any]) -> None:
         await self._execute(
-            GraphQueries.upsert_transcript(),
+            GraphQueries.UPSERT_TRANSCRIPT,
             {"transcript_id": transcript["transcript_id"], "props": transcript},
         )
 
     async def bm25_search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
-        records = await self._execute(GraphQueries.bm25_search(), {"query": query, "limit": limit})
+        records = await self._execute(GraphQueries.BM25_SEARCH, {"query": query, "limit": limit})
         return records
 
     async def entity_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-        return await self._execute(GraphQueries.entity_search(), {"query": query, "limit": limit})
+        return await self._execute(GraphQueries.ENTITY_SEARCH, {"query": query, "limit": limit})
 
     async def traverse_related(self, element_ids: Iterable[str], limit: int = 100) -> List[Dict[str, Any]]:
         return await self._execute(
-            GraphQueries.match_related_entities(),
+            GraphQueries.MATCH_RELATED_ENTITIES,
             {"element_ids": list(element_ids), "limit": limit},
         )
 
     async def set_block_vector(self, block_id: str, vector: List[float]) -> None:
         await self._execute(
-            GraphQueries.set_block_vector(),
+            GraphQueries.SET_BLOCK_VECTOR,
             {"block_id": block_id, "vector": vector},
         )
 
+    async def set_block_vectors(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        records = await self._execute(GraphQueries.SET_BLOCK_VECTORS_BULK, {"rows": rows})
+        # apoc.periodic.iterate reports failed batches in its result instead of raising.
+        summary = records[0] if records else {}
+        if summary.get("failedBatches"):
+            raise RuntimeError(
+                f"Failed to write {summary['failedBatches']} block vector batch(es): {summary.get('errorMessages')}"
+            )
+
     async def link_image_file(self, image_id: str, sha256: str) -> None:
         await self._execute(
-            GraphQueries.link_image_file(),
+            GraphQueries.LINK_IMAGE_FILE,
             {"image_id": image_id, "sha256": sha256},
         )
 
@@ -164,25 +205,31 @@ class GraphService:
         blocks: List[Dict[str, Any]],
         relationships: List[Dict[str, Any]],
     ) -> None:
-        statements: List[tuple[str, Dict[str, Any]]] = []
-        statements.append((GraphQueries.upsert_document(), {"doc_id": document["doc_id"], "props": document}))
-        for file_obj in files:
-            statements.append((GraphQueries.upsert_file(), {"sha256": file_obj["sha256"], "props": file_obj}))
-            statements.append(
-                (
-                    GraphQueries.link_document_file(),
-                    {"doc_id": document["doc_id"], "sha256": file_obj["sha256"]},
-                )
-            )
-        for page in pages:
-            statements.append((GraphQueries.upsert_page(), {"page_id": page["page_id"], "props": page}))
-            statements.append((GraphQueries.link_page_document(), {"page_id": page["page_id"], "doc_id": document["doc_id"]}))
-        for block in blocks:
-            statements.append((GraphQueries.upsert_block(), {"block_id": block["block_id"], "props": block}))
-            statements.append((GraphQueries.link_block_page(), {"block_id": block["block_id"], "page_id": block["page_id"]}))
-        for rel in relationships:
-            statements.append((GraphQueries.create_document_relationships(), {"relations": [rel]}))
-        await self.run_in_transaction(statements)
+        doc_id = document["doc_id"]
+        file_rows = [{"sha256": file_obj["sha256"], "props": _sanitize(file_obj)} for file_obj in files]
+        page_rows = [{"page_id": page["page_id"], "props": _sanitize(page)} for page in pages]
+        block_rows = [
+            {"block_id": block["block_id"], "page_id": block.get("page_id"), "props": _sanitize(block)} for block in blocks
+        ]
+        node_statements: List[tuple[str, Dict[str, Any]]] = [
+            (GraphQueries.UPSERT_DOCUMENT, {"doc_id": doc_id, "props": _sanitize(document)}),
+        ]
+        link_statements: List[tuple[str, Dict[str, Any]]] = []
+        if file_rows:
+            node_statements.append((GraphQueries.UPSERT_FILES_BULK, {"rows": file_rows}))
+            link_statements.append((GraphQueries.LINK_DOCUMENT_FILES_BULK, {"doc_id": doc_id, "rows": file_rows}))
+        if page_rows:
+            node_statements.append((GraphQueries.UPSERT_PAGES_BULK, {"rows": page_rows}))
+            link_statements.append((GraphQueries.LINK_PAGES_DOCUMENT_BULK, {"doc_id": doc_id, "rows": page_rows}))
+        if block_rows:
+            node_statements.append((GraphQueries.UPSERT_BLOCKS_BULK, {"rows": block_rows}))
+            link_statements.append((GraphQueries.LINK_BLOCKS_PAGE_BULK, {"rows": block_rows}))
+        if relationships:
+            link_statements.append((GraphQueries.CREATE_DOCUMENT_RELATIONSHIPS, {"relations": relationships}))
+        # Node upserts touch disjoint labels, so each gets its own session; links need them all in place.
+        await asyncio.gather(*(self.run_in_transaction([statement]) for statement in node_statements))
+        if link_statements:
+            await self.run_in_transaction(link_statements)
         log_event(logger, "graph.document_ingested", doc_id=document["doc_id"], blocks=len(blocks))
 
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import queue
 import sys
 import uuid
 from contextvars import ContextVar
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 request_id_ctx_var: ContextVar[str] = ContextVar("request_id", default="-")
+_listener: Optional[QueueListener] = None
 
 
 class RequestIDFilter(logging.Filter):
@@ -18,16 +22,42 @@ class RequestIDFilter(logging.Filter):
         return True
 
 
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        return orjson.dumps(log_record, default=self.json_default or str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    # The stock prepare() formats on the caller's thread and strips exc_info; leave both to the listener.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def configure_logging(level: str = "INFO") -> None:
+    global _listener
     log_handler = logging.StreamHandler(sys.stdout)
-    formatter = jsonlogger.JsonFormatter("%(asctime)s %(name)s %(levelname)s %(request_id)s %(message)s")
-    log_handler.setFormatter(formatter)
-    log_handler.addFilter(RequestIDFilter())
+    log_handler.setFormatter(OrjsonFormatter("%(asctime)s %(name)s %(levelname)s %(request_id)s %(message)s"))
+    # Formatting and the stdout write happen on the listener thread; callers only enqueue.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredFormatQueueHandler(log_queue)
+    # The request id lives in a ContextVar, so stamp it on the calling thread before the record is queued.
+    queue_handler.addFilter(RequestIDFilter())
+    listener = QueueListener(log_queue, log_handler)
+    listener.start()
 
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     root_logger.handlers.clear()
-    root_logger.addHandler(log_handler)
+    root_logger.addHandler(queue_handler)
+
+    if _listener is not None:
+        _listener.stop()
+    _listener = listener
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
 
 
 def set_request_id(value: str | None = None) -> str:
@@ -36,8 +66,10 @@ def set_request_id(value: str | None = None) -> str:
     return request_id
 
 
-def log_event(logger: logging.Logger, event: str, **fields: Any) -> None:
-    logger.info(json.dumps({"event": event, **fields}))
+def log_event(logger: logging.Logger, event: str, *, level: int = logging.INFO, **fields: Any) -> None:
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"event": event, **fields})
 
 
 configure_logging()
+atexit.register(_stop_listener)
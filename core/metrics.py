@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from prometheus_client import CollectorRegistry, Counter
+
+registry = CollectorRegistry()
+CACHE_HITS = Counter("pkb_cache_hits", "Valkey cache hits", registry=registry)
+CACHE_MISSES = Counter("pkb_cache_misses", "Valkey cache misses", registry=registry)
+QUEUE_ENQUEUED = Counter("pkb_queue_enqueued", "Items pushed onto Valkey work queues", ["queue"], registry=registry)
+QUEUE_DEQUEUED = Counter("pkb_queue_dequeued", "Items popped from Valkey work queues", ["queue"], registry=registry)
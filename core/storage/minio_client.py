@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Optional
+from urllib.parse import urlparse
 
+import urllib3
 from minio import Minio
 from minio.commonconfig import Tags
 
@@ -13,43 +18,78 @@ from core.logging import log_event
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_PART_SIZE = 64 * 1024 * 1024
+
+
+def build_minio_client(max_connections: int) -> Minio:
+    # minio's default urllib3 pool keeps 10 connections; size it to the caller's workers instead.
+    http_client = urllib3.PoolManager(
+        num_pools=1,
+        maxsize=max_connections,
+        block=False,
+        timeout=urllib3.Timeout(connect=300, read=300),
+        retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+    return Minio(
+        endpoint=urlparse(settings.minio_endpoint).netloc or settings.minio_endpoint,
+        access_key=settings.minio_access_key,
+        secret_key=settings.minio_secret_key,
+        secure=settings.minio_secure,
+        http_client=http_client,
+    )
+
 
 class MinioStorage:
     def __init__(self) -> None:
-        endpoint = settings.minio_endpoint.replace("http://", "").replace("https://", "")
-        self._client = Minio(
-            endpoint=endpoint,
-            access_key=settings.minio_access_key,
-            secret_key=settings.minio_secret_key,
-            secure=settings.minio_secure,
-        )
+        self._client = build_minio_client(settings.minio_io_concurrency)
         self._bucket = settings.minio_bucket
+        self._bucket_ready = False
+        self._bucket_lock = asyncio.Lock()
+        # One worker per pooled connection, so a blocking call never waits on the pool.
+        self._pool = ThreadPoolExecutor(max_workers=settings.minio_io_concurrency, thread_name_prefix="minio")
+
+    async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
 
     async def ensure_bucket(self) -> None:
-        exists = await asyncio.to_thread(self._client.bucket_exists, self._bucket)
-        if not exists:
-            await asyncio.to_thread(self._client.make_bucket, self._bucket)
+        if self._bucket_ready:
+            return
+        async with self._bucket_lock:
+            if self._bucket_ready:
+                return
+            exists = await self._run(self._client.bucket_exists, self._bucket)
+            if not exists:
+                await self._run(self._client.make_bucket, self._bucket)
+            self._bucket_ready = True
 
     async def ping(self) -> bool:
-        await self.ensure_bucket()
+        # Always round-trip so health checks see a real MinIO response, not the cached bucket state.
+        await self._run(self._client.bucket_exists, self._bucket)
         return True
 
     async def upload_file(self, object_name: str, file_path: Path, content_type: str, tags: Optional[dict[str, str]] = None) -> str:
         await self.ensure_bucket()
-        await asyncio.to_thread(
-            self._client.fput_object,
-            self._bucket,
-            object_name,
-            str(file_path),
-            content_type=content_type,
-            tags=Tags(tags or {}),
-        )
+        await self._run(self._put_file, object_name, file_path, content_type, Tags(tags or {}))
         log_event(logger, "storage.upload", object=object_name)
         return f"{settings.minio_endpoint}/{self._bucket}/{object_name}"
 
+    def _put_file(self, object_name: str, file_path: Path, content_type: str, tags: Tags) -> None:
+        size = os.stat(file_path).st_size
+        with open(file_path, "rb", buffering=UPLOAD_PART_SIZE) as fh:
+            self._client.put_object(
+                self._bucket,
+                object_name,
+                fh,
+                size,
+                content_type=content_type,
+                tags=tags,
+                part_size=UPLOAD_PART_SIZE,
+            )
+
     async def upload_stream(self, object_name: str, stream: BinaryIO, length: int, content_type: str) -> str:
         await self.ensure_bucket()
-        await asyncio.to_thread(
+        await self._run(
             self._client.put_object,
             self._bucket,
             object_name,
@@ -62,7 +102,7 @@ class MinioStorage:
 
     async def download_to_path(self, object_name: str, destination: Path) -> Path:
         await self.ensure_bucket()
-        await asyncio.to_thread(self._client.fget_object, self._bucket, object_name, str(destination))
+        await self._run(self._client.fget_object, self._bucket, object_name, str(destination))
         return destination
 
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import subprocess
+import sys
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -12,6 +13,8 @@ from core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_TTL_NS = 250_000_000
+
 
 @dataclass
 class MemorySnapshot:
@@ -26,15 +29,20 @@ class MemorySnapshot:
 class MemoryGuard:
     def __init__(self, min_free_bytes: int = settings.backpressure_free_mem_bytes) -> None:
         self._min_free_bytes = min_free_bytes
+        self._cached: tuple[int, MemorySnapshot] | None = None
 
     @property
     def min_free_bytes(self) -> int:
         return self._min_free_bytes
 
     def snapshot(self) -> MemorySnapshot:
+        now = time.monotonic_ns()
+        cached = self._cached
+        if cached is not None and now - cached[0] < SNAPSHOT_TTL_NS:
+            return cached[1]
         vm = psutil.virtual_memory()
         mps_free = self._query_mps_free_memory()
-        return MemorySnapshot(
+        snap = MemorySnapshot(
             total=vm.total,
             available=vm.available,
             free=vm.free,
@@ -42,6 +50,8 @@ class MemoryGuard:
             percent=vm.percent,
             mps_free=mps_free,
         )
+        self._cached = (now, snap)
+        return snap
 
     def is_under_pressure(self) -> bool:
         snap = self.snapshot()
@@ -55,15 +65,14 @@ class MemoryGuard:
             await asyncio.sleep(2)
 
     def _query_mps_free_memory(self) -> Optional[int]:
+        # MPS allocations belong to this process, so only probe once the embedding services have loaded torch.
+        torch = sys.modules.get("torch")
+        if torch is None:
+            return None
         try:
-            result = subprocess.run(
-                ["/usr/bin/python3", "-c", "import torch; print(torch.mps.driver_allocated_memory())"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            value = int(result.stdout.strip())
-            return value
+            if not torch.backends.mps.is_available():
+                return None
+            return int(torch.mps.driver_allocated_memory())
         except Exception:
             return None
 
@@ -1,26 +1,74 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
 import lancedb
+import numpy as np
+import pyarrow as pa
 
 from core.config import settings
 from core.logging import log_event
 
 logger = logging.getLogger(__name__)
 
+_COLUMN_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# Cached table handles pick up writes from other processes (workers) within this window.
+READ_CONSISTENCY_INTERVAL = timedelta(seconds=5)
+LANCEDB_IO_WORKERS = 8
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _build_filter(filters: Dict[str, Any]) -> str:
+    clauses: List[str] = []
+    for key, value in filters.items():
+        if not _COLUMN_RE.match(key):
+            raise ValueError(f"Invalid filter column: {key!r}")
+        clauses.append(f"{key} IS NULL" if value is None else f"{key} = {_sql_literal(value)}")
+    return " AND ".join(clauses)
+
+
+def build_batch(records: List[Dict[str, Any]], vector_column: str = "vector") -> pa.RecordBatch:
+    columns = {key: [record.get(key) for record in records] for key in records[0]}
+    vectors = np.asarray(columns[vector_column], dtype=np.float32)
+    arrays = {key: pa.array(values) for key, values in columns.items() if key != vector_column}
+    arrays[vector_column] = pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1)), vectors.shape[1])
+    return pa.RecordBatch.from_pydict(arrays)
+
 
 class LanceDBClient:
     def __init__(self, uri: str | None = None) -> None:
         self._uri = uri or settings.lancedb_uri
         Path(self._uri).mkdir(parents=True, exist_ok=True)
-        self._db = lancedb.connect(self._uri)
+        self._db = lancedb.connect(self._uri, read_consistency_interval=READ_CONSISTENCY_INTERVAL)
+        self._tables: Dict[str, Any] = {}
+        # Serialises first writes per table so concurrent upserts don't both try to create it.
+        self._create_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._pool = ThreadPoolExecutor(max_workers=LANCEDB_IO_WORKERS, thread_name_prefix="lance")
 
     async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        return await asyncio.to_thread(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+
+    def _open_table(self, table_name: str) -> Any | None:
+        table = self._tables.get(table_name)
+        if table is None and table_name in self._db.table_names():
+            table = self._tables[table_name] = self._db.open_table(table_name)
+        return table
 
     async def health_check(self) -> bool:
         await self._run(self._db.table_names)
@@ -29,17 +77,24 @@ class LanceDBClient:
     async def upsert_vectors(
         self,
         table_name: str,
-        records: Iterable[Dict[str, Any]],
+        records: Iterable[Dict[str, Any]] | pa.RecordBatch,
         primary_key: str = "id",
     ) -> None:
-        payload = list(records)
-        if not payload:
-            return
-        if table_name not in self._db.table_names():
-            self._db.create_table(table_name, data=payload)
-            log_event(logger, "vectors.create_table", table=table_name, count=len(payload))
+        if isinstance(records, pa.RecordBatch):
+            payload: Any = pa.Table.from_batches([records])
+        else:
+            rows = list(records)
+            payload = pa.Table.from_batches([build_batch(rows)]) if rows and "vector" in rows[0] else rows
+        if not len(payload):
             return
-        table = self._db.open_table(table_name)
+        table = self._open_table(table_name)
+        if table is None:
+            async with self._create_locks[table_name]:
+                table = self._open_table(table_name)
+                if table is None:
+                    self._tables[table_name] = await self._run(self._db.create_table, table_name, data=payload)
+                    log_event(logger, "vectors.create_table", table=table_name, count=len(payload))
+                    return
         await self._run(table.merge_insert, payload, on=primary_key)
         log_event(logger, "vectors.upsert", table=table_name, count=len(payload))
 
@@ -50,13 +105,12 @@ class LanceDBClient:
         limit: int = 20,
         filters: Dict[str, Any] | None = None,
     ) -> List[Dict[str, Any]]:
-        if table_name not in self._db.table_names():
+        table = self._open_table(table_name)
+        if table is None:
             return []
-        table = self._db.open_table(table_name)
         query = table.search(vector)
         if filters:
-            for key, value in filters.items():
-                query = query.where(f"{key} = '{value}'")
+            query = query.where(_build_filter(filters))
         result = await self._run(query.limit, limit)
         return [row.as_dict() for row in result]
 
@@ -68,9 +122,9 @@ class LanceDBClient:
         alpha: float = 0.5,
         limit: int = 20,
     ) -> List[Dict[str, Any]]:
-        if table_name not in self._db.table_names():
+        table = self._open_table(table_name)
+        if table is None:
             return []
-        table = self._db.open_table(table_name)
         query = table.search(dense_vector).with_hybrid(dense=dense_vector, sparse=sparse_vector, alpha=alpha)
         result = await self._run(query.limit, limit)
         return [row.as_dict() for row in result]
@@ -1,76 +1,133 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
-from minio import Minio
-from neo4j import AsyncGraphDatabase
+import orjson
 from redis.asyncio import Redis
 
 from core.config import settings
+from core.graph.client import graph_service
+from core.graph.queries import PRIMARY_KEYS
+from core.storage.minio_client import build_minio_client
 
 
 BACKUP_ROOT = Path(settings.backup_path).expanduser()
 BACKUP_ROOT.mkdir(parents=True, exist_ok=True)
 
+VALKEY_SCAN_COUNT = 1000
 
-PRIMARY_KEYS = {
-    "Document": "doc_id",
-    "File": "sha256",
-    "Email": "message_id",
-    "Page": "page_id",
-    "Block": "block_id",
-    "Image": "image_id",
-    "Audio": "audio_id",
-    "Transcript": "transcript_id",
-    "Person": "person_id",
-    "Organization": "org_id",
-    "Project": "project_id",
-    "Event": "event_id",
-    "Place": "place_id",
-}
-
-
-def _primary_reference(labels: List[str], properties: Dict[str, Any]) -> Dict[str, str] | None:
+
+# Map projection of every primary-key property, so an endpoint's primary label is resolved client-side.
+_KEY_PROJECTION = "{" + ", ".join(f".{key}" for key in dict.fromkeys(PRIMARY_KEYS.values())) + "}"
+
+
+def _primary_label(labels: List[str], values: Dict[str, Any]) -> str | None:
+    # A node's first label with its primary key set, mirroring how restore re-MERGEs nodes.
     for label in labels:
         key = PRIMARY_KEYS.get(label)
-        if key and key in properties:
-            return {"label": label, "key": key, "value": properties[key]}
+        if key and values.get(key) is not None:
+            return label
     return None
 
 
+def _reference(label: str | None, value: Any) -> Dict[str, Any] | None:
+    if label is None:
+        return None
+    return {"label": label, "key": PRIMARY_KEYS[label], "value": value}
+
+
+def _json_default(value: Any) -> Any:
+    # neo4j temporal types (datetime() stamps on Document and friends)
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+
+def _ndjson_line(row: Dict[str, Any]) -> bytes:
+    return orjson.dumps(row, default=_json_default) + b"\n"
+
+
+def _primary_reference(labels: List[str], values: Dict[str, Any]) -> Dict[str, Any] | None:
+    label = _primary_label(labels, values)
+    return _reference(label, values[PRIMARY_KEYS[label]]) if label else None
+
+
 async def export_neo4j(target: Path) -> None:
-    driver = AsyncGraphDatabase.driver(settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password))
-    async with driver.session() as session:
-        node_result = await session.run("MATCH (n) RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties")
-        nodes: List[Dict[str, Any]] = []
-        primary_map: Dict[str, Dict[str, str]] = {}
-        for record in await node_result.to_list():
-            data = record.data()
-            primary = _primary_reference(data["labels"], data["properties"])
-            if primary:
-                primary_map[data["id"]] = primary
-            nodes.append({"labels": data["labels"], "properties": data["properties"], "primary": primary})
-        rel_result = await session.run(
-            "MATCH (a)-[r]->(b) RETURN type(r) AS type, properties(r) AS properties, elementId(a) AS start, elementId(b) AS end"
-        )
-        rels: List[Dict[str, Any]] = []
-        for record in await rel_result.to_list():
-            data = record.data()
-            rels.append(
-                {
-                    "type": data["type"],
-                    "properties": data["properties"],
-                    "start": primary_map.get(data["start"]),
-                    "end": primary_map.get(data["end"]),
-                }
-            )
-    await driver.close()
-    (target / "neo4j.json").write_text(json.dumps({"nodes": nodes, "relationships": rels}, indent=2))
+    exported = 0
+    with open(target / "neo4j.ndjson", "wb") as fh:
+
+        def write_node(labels: List[str], properties: Dict[str, Any], primary: Dict[str, Any] | None) -> None:
+            nonlocal exported
+            fh.write(_ndjson_line({"t": "node", "labels": labels, "properties": properties, "primary": primary}))
+            exported += 1
+
+        async with graph_service.session() as session:
+            # One label scan per keyed label; labels(n) is only materialised for multi-label nodes.
+            for label, key in PRIMARY_KEYS.items():
+                result = await session.run(
+                    f"MATCH (n:{label}) RETURN n.{key} AS pk, properties(n) AS properties, "
+                    "CASE WHEN size(labels(n)) > 1 THEN labels(n) END AS labels"
+                )
+                async for record in result:
+                    labels = record["labels"]
+                    if labels is None:
+                        primary = _reference(label, record["pk"]) if record["pk"] is not None else None
+                        write_node([label], record["properties"], primary)
+                        continue
+                    # Multi-label nodes are written once, from the pass of the label that owns them.
+                    primary = _primary_reference(labels, record["properties"])
+                    owner = primary["label"] if primary else next(n for n in labels if n in PRIMARY_KEYS)
+                    if owner == label:
+                        write_node(labels, record["properties"], primary)
+
+            # Nodes carrying only labels outside PRIMARY_KEYS, each written from its first label's pass.
+            result = await session.run("CALL db.labels() YIELD label RETURN label")
+            other_labels = [record["label"] async for record in result if record["label"] not in PRIMARY_KEYS]
+            for label in other_labels:
+                result = await session.run(
+                    f"MATCH (n:`{label.replace('`', '``')}`) WHERE none(name IN labels(n) WHERE name IN $keyed) "
+                    "RETURN labels(n) AS labels, properties(n) AS properties",
+                    keyed=list(PRIMARY_KEYS),
+                )
+                async for record in result:
+                    if record["labels"][0] == label:
+                        write_node(record["labels"], record["properties"], None)
+
+            # count(n) comes from the count store; only scan for label-less nodes if some were missed.
+            total = (await (await session.run("MATCH (n) RETURN count(n) AS total")).single())["total"]
+            if total > exported:
+                result = await session.run("MATCH (n) WHERE size(labels(n)) = 0 RETURN properties(n) AS properties")
+                async for record in result:
+                    write_node([], record["properties"], None)
+
+            # Relationships are expanded from keyed start nodes only: restore cannot re-attach the rest.
+            for label, key in PRIMARY_KEYS.items():
+                result = await session.run(
+                    f"MATCH (a:{label})-[r]->(b) WHERE a.{key} IS NOT NULL "
+                    f"RETURN type(r) AS type, properties(r) AS properties, a.{key} AS start_value, "
+                    "CASE WHEN size(labels(a)) > 1 THEN labels(a) END AS start_labels, "
+                    f"CASE WHEN size(labels(a)) > 1 THEN a {_KEY_PROJECTION} END AS start_keys, "
+                    f"labels(b) AS end_labels, b {_KEY_PROJECTION} AS end_keys"
+                )
+                async for record in result:
+                    start_labels = record["start_labels"]
+                    if start_labels is not None and _primary_label(start_labels, record["start_keys"]) != label:
+                        continue
+                    fh.write(
+                        _ndjson_line(
+                            {
+                                "t": "rel",
+                                "type": record["type"],
+                                "properties": record["properties"],
+                                "start": _reference(label, record["start_value"]),
+                                "end": _primary_reference(record["end_labels"], record["end_keys"]),
+                            }
+                        )
+                    )
 
 
 def export_lancedb(target: Path) -> None:
@@ -80,49 +137,69 @@ def export_lancedb(target: Path) -> None:
     shutil.make_archive(str(target / "lancedb"), "zip", root_dir=source)
 
 
-def export_minio(target: Path) -> None:
-    client = Minio(
-        endpoint=settings.minio_endpoint.replace("http://", "").replace("https://", ""),
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=settings.minio_secure,
-    )
+async def export_minio(target: Path) -> None:
+    client = build_minio_client(settings.minio_io_concurrency)
     bucket = settings.minio_bucket
-    objects = client.list_objects(bucket, recursive=True)
+
+    def list_names() -> List[str]:
+        return [obj.object_name for obj in client.list_objects(bucket, recursive=True) if not obj.is_dir]
+
+    objects = await asyncio.to_thread(list_names)
     artifact_dir = target / "minio"
     artifact_dir.mkdir(parents=True, exist_ok=True)
-    for obj in objects:
-        data = client.get_object(bucket, obj.object_name)
-        file_path = artifact_dir / obj.object_name
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "wb") as fh:
-            shutil.copyfileobj(data, fh)
-        data.close()
-        data.release_conn()
+    semaphore = asyncio.Semaphore(settings.minio_io_concurrency)
 
+    async def download(object_name: str) -> None:
+        async with semaphore:
+            await asyncio.to_thread(client.fget_object, bucket, object_name, str(artifact_dir / object_name))
 
-async def export_valkey(target: Path) -> None:
-    client = Redis(host=settings.valkey_host, port=settings.valkey_port, decode_responses=True)
-    cursor = "0"
-    snapshot: Dict[str, Any] = {}
-    while True:
-        cursor, keys = await client.scan(cursor=cursor, count=100)
+    await asyncio.gather(*(download(name) for name in objects))
+
+
+async def _fetch_valkey_batch(client: Redis, keys: List[str]) -> Dict[str, Any]:
+    batch: Dict[str, Any] = {}
+    async with client.pipeline(transaction=False) as pipe:
         for key in keys:
-            key_type = await client.type(key)
-            if key_type == "string":
-                snapshot[key] = await client.get(key)
-            elif key_type == "hash":
-                snapshot[key] = await client.hgetall(key)
+            pipe.type(key)
+        key_types = await pipe.execute()
+        string_keys = [key for key, key_type in zip(keys, key_types) if key_type == "string"]
+        if string_keys:
+            pipe.mget(string_keys)
+        typed_keys: List[tuple[str, str]] = []
+        for key, key_type in zip(keys, key_types):
+            if key_type == "hash":
+                pipe.hgetall(key)
             elif key_type == "list":
-                snapshot[key] = await client.lrange(key, 0, -1)
+                pipe.lrange(key, 0, -1)
             elif key_type == "set":
-                snapshot[key] = list(await client.smembers(key))
+                pipe.smembers(key)
             elif key_type == "zset":
-                snapshot[key] = await client.zrange(key, 0, -1, withscores=True)
-        if cursor == "0":
+                pipe.zrange(key, 0, -1, withscores=True)
+            else:
+                continue
+            typed_keys.append((key, key_type))
+        if not string_keys and not typed_keys:
+            return batch
+        results = await pipe.execute()
+    if string_keys:
+        batch.update(zip(string_keys, results.pop(0)))
+    for (key, key_type), value in zip(typed_keys, results):
+        batch[key] = list(value) if key_type == "set" else value
+    return batch
+
+
+async def export_valkey(target: Path) -> None:
+    client = Redis(host=settings.valkey_host, port=settings.valkey_port, decode_responses=True)
+    cursor = 0
+    snapshot: Dict[str, Any] = {}
+    while True:
+        cursor, keys = await client.scan(cursor=cursor, count=VALKEY_SCAN_COUNT)
+        if keys:
+            snapshot.update(await _fetch_valkey_batch(client, keys))
+        if int(cursor) == 0:
             break
     await client.close()
-    (target / "valkey.json").write_text(json.dumps(snapshot, indent=2))
+    (target / "valkey.json").write_bytes(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
 
 
 async def main() -> None:
@@ -130,10 +207,14 @@ async def main() -> None:
     target = BACKUP_ROOT / timestamp
     target.mkdir(parents=True, exist_ok=True)
 
-    await export_neo4j(target)
-    export_lancedb(target)
-    export_minio(target)
-    await export_valkey(target)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(export_neo4j(target))
+            tg.create_task(asyncio.to_thread(export_lancedb, target))
+            tg.create_task(export_minio(target))
+            tg.create_task(export_valkey(target))
+    finally:
+        await graph_service.close()
 
     metadata = {
         "created_at": datetime.now(timezone.utc).isoformat(),
@@ -141,7 +222,7 @@ async def main() -> None:
         "lancedb_uri": settings.lancedb_uri,
         "minio_bucket": settings.minio_bucket,
     }
-    (target / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    (target / "metadata.json").write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
 
 if __name__ == "__main__":
@@ -4,10 +4,10 @@ import asyncio
 import json
 
 import httpx
-from neo4j import AsyncGraphDatabase
 from redis.asyncio import Redis
 
 from core.config import settings
+from core.graph.client import graph_service
 
 
 async def check_api() -> dict[str, str]:
@@ -19,12 +19,7 @@ async def check_api() -> dict[str, str]:
 
 
 async def check_neo4j() -> bool:
-    driver = AsyncGraphDatabase.driver(settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password))
-    async with driver.session() as session:
-        result = await session.run("RETURN 1")
-        record = await result.single()
-    await driver.close()
-    return bool(record and record[0] == 1)
+    return await graph_service.ping()
 
 
 async def check_valkey() -> bool:
@@ -34,19 +29,24 @@ async def check_valkey() -> bool:
     return bool(pong)
 
 
-async def main() -> None:
-    api_task = asyncio.create_task(check_api())
-    neo4j_task = asyncio.create_task(check_neo4j())
-    valkey_task = asyncio.create_task(check_valkey())
+def _status(outcome: object) -> object:
+    if isinstance(outcome, BaseException):
+        return {"status": "error", "reason": str(outcome) or type(outcome).__name__}
+    return outcome
+
 
-    api_status = await api_task
-    neo4j_status = await neo4j_task
-    valkey_status = await valkey_task
+async def main() -> None:
+    try:
+        api_status, neo4j_status, valkey_status = await asyncio.gather(
+            check_api(), check_neo4j(), check_valkey(), return_exceptions=True
+        )
+    finally:
+        await graph_service.close()
 
     result = {
-        "api": api_status,
-        "neo4j": neo4j_status,
-        "valkey": valkey_status,
+        "api": _status(api_status),
+        "neo4j": _status(neo4j_status),
+        "valkey": _status(valkey_status),
     }
     print(json.dumps(result, indent=2))
 
@@ -1,56 +1,135 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
 import shutil
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Tuple
 
-from minio import Minio
-from neo4j import AsyncGraphDatabase
+import ijson
+import orjson
+from minio.deleteobjects import DeleteObject
+from neo4j import AsyncSession
 from redis.asyncio import Redis
 
 from core.config import settings
+from core.graph.client import graph_service
+from core.graph.queries import PRIMARY_KEYS
+from core.storage.minio_client import build_minio_client
 
 
 BACKUP_ROOT = Path(settings.backup_path).expanduser()
 
+RESTORE_BATCH_SIZE = 10_000
+VALKEY_PIPELINE_SIZE = 1000
+LANCEDB_EXTRACT_WORKERS = 8
 
-async def restore_neo4j(source: Path) -> None:
-    data_path = source / "neo4j.json"
-    if not data_path.exists():
+
+def _iter_neo4j_backup(source: Path) -> Iterator[Dict[str, Any]]:
+    ndjson_path = source / "neo4j.ndjson"
+    if ndjson_path.exists():
+        with open(ndjson_path, "rb") as fh:
+            for line in fh:
+                if line.strip():
+                    yield orjson.loads(line)
         return
-    payload = json.loads(data_path.read_text())
-    driver = AsyncGraphDatabase.driver(settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password))
-    async with driver.session() as session:
-        await session.run("MATCH (n) DETACH DELETE n")
-        for node in payload.get("nodes", []):
-            labels = ":".join(node["labels"])
-            properties = node["properties"]
-            primary = node.get("primary")
-            if primary:
-                cypher = f"MERGE (n:{labels} {{{primary['key']}: $value}}) SET n += $props"
-                await session.run(cypher, value=primary["value"], props=properties)
-            else:
-                cypher = f"CREATE (n:{labels}) SET n += $props"
-                await session.run(cypher, props=properties)
-        for rel in payload.get("relationships", []):
-            start = rel.get("start")
-            end = rel.get("end")
+    # Backups taken before the NDJSON export wrote a single document; stream each array instead of loading it.
+    legacy_path = source / "neo4j.json"
+    if legacy_path.exists():
+        with open(legacy_path, "rb") as fh:
+            for node in ijson.items(fh, "nodes.item", use_float=True):
+                yield {"t": "node", **node}
+        with open(legacy_path, "rb") as fh:
+            for rel in ijson.items(fh, "relationships.item", use_float=True):
+                yield {"t": "rel", **rel}
+
+
+def _node_statement(labels: Tuple[str, ...], key: str | None) -> str:
+    label_clause = "".join(f":{label}" for label in labels)
+    if key:
+        return f"UNWIND $rows AS row MERGE (n{label_clause} {{{key}: row.value}}) SET n += row.props"
+    return f"UNWIND $rows AS row CREATE (n{label_clause}) SET n += row.props"
+
+
+def _relationship_statement(start_label: str, start_key: str, end_label: str, end_key: str, rel_type: str) -> str:
+    return (
+        f"UNWIND $rows AS row "
+        f"MATCH (a:{start_label} {{{start_key}: row.start_value}}) "
+        f"MATCH (b:{end_label} {{{end_key}: row.end_value}}) "
+        f"MERGE (a)-[r:{rel_type}]->(b) SET r += row.props"
+    )
+
+
+async def _write_batch(session: AsyncSession, cypher: str, rows: List[Dict[str, Any]]) -> None:
+    async with await session.begin_transaction() as tx:
+        await tx.run(cypher, rows=rows)
+        await tx.commit()
+
+
+async def restore_neo4j(source: Path, create_constraints: bool = True) -> None:
+    if not (source / "neo4j.ndjson").exists() and not (source / "neo4j.json").exists():
+        return
+    async with graph_service.session() as session:
+        # Batched wipe keeps transaction state bounded on large graphs instead of one giant DETACH DELETE.
+        wipe = await session.run(
+            "CALL apoc.periodic.iterate('MATCH (n) RETURN n', 'DETACH DELETE n', {batchSize: $batch_size, parallel: false}) "
+            "YIELD failedBatches, errorMessages RETURN failedBatches, errorMessages",
+            batch_size=RESTORE_BATCH_SIZE,
+        )
+        summary = await wipe.single()
+        # apoc.periodic.iterate reports failed batches instead of raising; never restore over a partial wipe.
+        if summary and summary["failedBatches"]:
+            raise RuntimeError(
+                f"Neo4j wipe failed in {summary['failedBatches']} batch(es): {summary['errorMessages']}"
+            )
+
+        node_groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        rel_groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        constrained: set[str] = set()
+
+        async def flush(groups: Dict[str, List[Dict[str, Any]]]) -> None:
+            for cypher, rows in groups.items():
+                if rows:
+                    await _write_batch(session, cypher, rows)
+            groups.clear()
+
+        for row in _iter_neo4j_backup(source):
+            if row["t"] == "node":
+                primary = row.get("primary")
+                # Index-backed MERGE/MATCH on primary keys instead of label scans during the load. Only labels
+                # that occur in the dump get a constraint, created before the first write that uses it.
+                label = primary["label"] if primary else None
+                if create_constraints and label and label not in constrained and label in PRIMARY_KEYS:
+                    constraint = await session.run(
+                        f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.{PRIMARY_KEYS[label]} IS UNIQUE"
+                    )
+                    await constraint.consume()
+                    constrained.add(label)
+                cypher = _node_statement(tuple(row["labels"]), primary["key"] if primary else None)
+                rows = node_groups[cypher]
+                rows.append({"value": primary["value"] if primary else None, "props": row["properties"]})
+                if len(rows) >= RESTORE_BATCH_SIZE:
+                    await _write_batch(session, cypher, rows)
+                    node_groups[cypher] = []
+                continue
+            # Relationships follow all nodes in the backup; make sure every node is written first.
+            if node_groups:
+                await flush(node_groups)
+            start = row.get("start")
+            end = row.get("end")
             if not start or not end:
                 continue
-            cypher = (
-                f"MATCH (a:{start['label']} {{{start['key']}: $start_value}}) "
-                f"MATCH (b:{end['label']} {{{end['key']}: $end_value}}) "
-                f"MERGE (a)-[r:{rel['type']}]->(b) SET r += $props"
-            )
-            await session.run(
-                cypher,
-                start_value=start["value"],
-                end_value=end["value"],
-                props=rel.get("properties", {}),
-            )
-    await driver.close()
+            cypher = _relationship_statement(start["label"], start["key"], end["label"], end["key"], row["type"])
+            rows = rel_groups[cypher]
+            rows.append({"start_value": start["value"], "end_value": end["value"], "props": row.get("properties", {})})
+            if len(rows) >= RESTORE_BATCH_SIZE:
+                await _write_batch(session, cypher, rows)
+                rel_groups[cypher] = []
+        await flush(node_groups)
+        await flush(rel_groups)
 
 
 def restore_lancedb(source: Path) -> None:
@@ -58,63 +137,103 @@ def restore_lancedb(source: Path) -> None:
     if not archive.exists():
         return
     target = Path(settings.lancedb_uri)
-    if target.exists():
-        shutil.rmtree(target)
-    target.mkdir(parents=True, exist_ok=True)
-    shutil.unpack_archive(archive, target)
+    with ThreadPoolExecutor(max_workers=LANCEDB_EXTRACT_WORKERS, thread_name_prefix="restore-lancedb") as executor:
+        cleanup = None
+        if target.exists():
+            # Move the old tree aside so deleting it overlaps with extraction.
+            stale = target.with_name(f"{target.name}.stale-{os.getpid()}")
+            target.rename(stale)
+            cleanup = executor.submit(shutil.rmtree, stale)
+        target.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(archive) as zf:
+            members = zf.infolist()
+            # ZipFile.extract races on creating shared parent directories, so create them up front.
+            for directory in {(target / info.filename).parent for info in members}:
+                directory.mkdir(parents=True, exist_ok=True)
+            futures = [executor.submit(zf.extract, info, target) for info in members if not info.is_dir()]
+            for future in as_completed(futures):
+                future.result()
+        if cleanup is not None:
+            cleanup.result()
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    # DirEntry.is_dir/is_file reuse the d_type from scandir, so there is no extra stat per entry.
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
 
 
 def restore_minio(source: Path) -> None:
     artifact_dir = source / "minio"
     if not artifact_dir.exists():
         return
-    client = Minio(
-        endpoint=settings.minio_endpoint.replace("http://", "").replace("https://", ""),
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=settings.minio_secure,
-    )
+    workers = min(max(settings.minio_io_concurrency, 1), 64)
+    client = build_minio_client(workers)
     bucket = settings.minio_bucket
     if not client.bucket_exists(bucket):
         client.make_bucket(bucket)
     else:
-        for obj in client.list_objects(bucket, recursive=True):
-            client.remove_object(bucket, obj.object_name)
-    for file_path in artifact_dir.rglob("*"):
-        if file_path.is_file():
-            object_name = str(file_path.relative_to(artifact_dir))
-            client.fput_object(bucket, object_name, str(file_path))
+        stale = (DeleteObject(obj.object_name) for obj in client.list_objects(bucket, recursive=True))
+        for error in client.remove_objects(bucket, stale):
+            raise RuntimeError(f"Failed to clear {error.name} from {bucket}: {error.message}")
+    root = str(artifact_dir)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore-minio") as executor:
+        futures = [
+            executor.submit(client.fput_object, bucket, os.path.relpath(path, root), path)
+            for path in _walk_files(root)
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
 async def restore_valkey(source: Path) -> None:
     snapshot_path = source / "valkey.json"
     if not snapshot_path.exists():
         return
-    snapshot = json.loads(snapshot_path.read_text())
+    snapshot = orjson.loads(snapshot_path.read_bytes())
     client = Redis(host=settings.valkey_host, port=settings.valkey_port, decode_responses=True)
     await client.flushdb()
-    for key, value in snapshot.items():
-        if isinstance(value, str):
-            await client.set(key, value)
-        elif isinstance(value, list):
-            await client.rpush(key, *value)
-        elif isinstance(value, dict):
-            await client.hset(key, mapping=value)
+    async with client.pipeline(transaction=False) as pipe:
+        queued = 0
+        for key, value in snapshot.items():
+            if isinstance(value, str):
+                pipe.set(key, value)
+            elif isinstance(value, list) and value:
+                pipe.rpush(key, *value)
+            elif isinstance(value, dict) and value:
+                pipe.hset(key, mapping=value)
+            else:
+                continue
+            queued += 1
+            if queued % VALKEY_PIPELINE_SIZE == 0:
+                await pipe.execute()
+        await pipe.execute()
     await client.close()
 
 
-async def main(backup_name: str | None = None) -> None:
+async def main(backup_name: str | None = None, create_constraints: bool = True) -> None:
     if backup_name:
         source = BACKUP_ROOT / backup_name
     else:
-        backups = sorted([p for p in BACKUP_ROOT.iterdir() if p.is_dir()])
+        # DirEntry.is_dir() answers from the scandir d_type, avoiding a stat per backup directory.
+        with os.scandir(BACKUP_ROOT) as entries:
+            backups = sorted(entry.name for entry in entries if entry.is_dir())
         if not backups:
             raise SystemExit("No backups found")
-        source = backups[-1]
-    await restore_neo4j(source)
-    restore_lancedb(source)
-    restore_minio(source)
-    await restore_valkey(source)
+        source = BACKUP_ROOT / backups[-1]
+    try:
+        await asyncio.gather(
+            restore_neo4j(source, create_constraints),
+            asyncio.to_thread(restore_lancedb, source),
+            asyncio.to_thread(restore_minio, source),
+            restore_valkey(source),
+        )
+    finally:
+        await graph_service.close()
 
 
 if __name__ == "__main__":
@@ -122,5 +241,11 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Restore Personal Knowledge Brain data")
     parser.add_argument("backup", nargs="?", help="Backup directory name")
+    parser.add_argument(
+        "--create-constraints",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Create a uniqueness constraint for each primary-keyed label in the dump (kept after the restore)",
+    )
     args = parser.parse_args()
-    asyncio.run(main(args.backup))
+    asyncio.run(main(args.backup, args.create_constraints))
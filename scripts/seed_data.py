@@ -3,9 +3,9 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
-from core.cache import valkey_client
+from core.cache.valkey_client import valkey_client
 
 QUEUE_NAME = "ingest:documents"
 
@@ -26,7 +26,7 @@ def create_sample_files() -> Dict[str, Path]:
     return {"alpha": alpha_path, "notes": notes_path}
 
 
-async def enqueue_document(path: Path, doc_id: str, title: str, project: str) -> None:
+def build_payload(path: Path, doc_id: str, title: str, project: str) -> Dict[str, Any]:
     created = datetime.now(timezone.utc).isoformat()
     payload = {
         "document": {
@@ -58,13 +58,16 @@ async def enqueue_document(path: Path, doc_id: str, title: str, project: str) ->
             "people": ["alice@example.com", "bob@example.com"],
         },
     }
-    await valkey_client.enqueue(QUEUE_NAME, payload)
+    return payload
 
 
 async def main() -> None:
     files = create_sample_files()
-    await enqueue_document(files["alpha"], "seed:project_alpha", "Project Alpha Overview", "Project Alpha")
-    await enqueue_document(files["notes"], "seed:meeting_notes", "Project Alpha – Kickoff Notes", "Project Alpha")
+    payloads = [
+        build_payload(files["alpha"], "seed:project_alpha", "Project Alpha Overview", "Project Alpha"),
+        build_payload(files["notes"], "seed:meeting_notes", "Project Alpha – Kickoff Notes", "Project Alpha"),
+    ]
+    await valkey_client.enqueue_many(QUEUE_NAME, payloads)
     print("Seed data enqueued")
 
 
@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import copy
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
@@ -18,15 +19,49 @@ from connectors.photos import GooglePhotosConnector
 from connectors.slack import SlackConnector
 from connectors.takeout import GoogleTakeoutConnector
 
+# One event loop for every connector test in this module instead of a fresh loop per test.
+pytestmark = pytest.mark.asyncio(scope="module")
+
+INITIAL_STATES: Dict[str, Dict[str, Any]] = {
+    "browser": {},
+    "calendar": {},
+    "drive": {"start_page_token": "1"},
+    "gmail": {},
+    "imap": {"last_uid": 0},
+    "local_fs": {"files": {}},
+    "notion": {},
+    "obsidian": {"files": {}},
+    "photos": {},
+    "slack": {},
+    "takeout": {"hashes": {}},
+}
+
+
+@pytest.fixture(autouse=True)
+def state_stubs(monkeypatch):
+    saved: Dict[str, Dict[str, Any]] = {}
+    for module, initial in INITIAL_STATES.items():
+        async def load_state(name: str, _initial: Dict[str, Any] = initial) -> Dict[str, Any]:
+            return copy.deepcopy(_initial)
+
+        async def save_state(name: str, state: Dict[str, Any]) -> None:
+            saved[name] = state
+
+        monkeypatch.setattr(f"connectors.{module}.load_state", load_state)
+        monkeypatch.setattr(f"connectors.{module}.save_state", save_state)
+
+    async def load_item(name: str, item_id: str) -> Dict[str, Any] | None:
+        return None
 
-@pytest.mark.asyncio
-async def test_gmail_connector(monkeypatch, tmp_path):
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
+    async def save_item(name: str, item_id: str, item: Dict[str, Any], ttl_seconds: int) -> None:
         return None
 
+    monkeypatch.setattr("connectors.notion.load_item", load_item)
+    monkeypatch.setattr("connectors.notion.save_item", save_item)
+    return saved
+
+
+async def test_gmail_connector(monkeypatch, tmp_path):
     class AttachmentStub:
         def get(self, userId: str, messageId: str, id: str):
             class Request:
@@ -102,8 +137,6 @@ async def test_gmail_connector(monkeypatch, tmp_path):
     async def stub_service(self):
         return ServiceStub()
 
-    monkeypatch.setattr("connectors.gmail.load_state", load_state)
-    monkeypatch.setattr("connectors.gmail.save_state", save_state)
     monkeypatch.setattr(GmailConnector, "_service", stub_service)
     connector = GmailConnector()
 
@@ -115,14 +148,7 @@ async def test_gmail_connector(monkeypatch, tmp_path):
     assert first["document"]["source"] == "gmail"
 
 
-@pytest.mark.asyncio
 async def test_drive_connector(monkeypatch, tmp_path):
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {"start_page_token": "1"}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
     class FilesStub:
         def export_media(self, fileId: str, mimeType: str):
             class Request:
@@ -191,8 +217,6 @@ async def test_drive_connector(monkeypatch, tmp_path):
     async def stub_service(self):
         return ServiceStub()
 
-    monkeypatch.setattr("connectors.drive.load_state", load_state)
-    monkeypatch.setattr("connectors.drive.save_state", save_state)
     monkeypatch.setattr(DriveConnector, "_service", stub_service)
 
     connector = DriveConnector()
@@ -203,14 +227,7 @@ async def test_drive_connector(monkeypatch, tmp_path):
     assert results[0]["document"]["source"] == "google_drive"
 
 
-@pytest.mark.asyncio
 async def test_calendar_connector(monkeypatch):
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
     class EventsStub:
         def list(self, **kwargs):
             class Request:
@@ -238,8 +255,6 @@ async def test_calendar_connector(monkeypatch):
     async def stub_service(self):
         return ServiceStub()
 
-    monkeypatch.setattr("connectors.calendar.load_state", load_state)
-    monkeypatch.setattr("connectors.calendar.save_state", save_state)
     monkeypatch.setattr(GoogleCalendarConnector, "_service", stub_service)
 
     connector = GoogleCalendarConnector()
@@ -250,7 +265,6 @@ async def test_calendar_connector(monkeypatch):
     assert results[0]["document"]["source"] == "google_calendar"
 
 
-@pytest.mark.asyncio
 async def test_slack_connector(monkeypatch):
     from core.config import settings
 
@@ -260,7 +274,7 @@ async def test_slack_connector(monkeypatch):
         async def conversations_list(self, limit: int):
             return {"channels": [{"id": "C01"}]}
 
-        async def conversations_history(self, channel: str, cursor: str | None, limit: int, inclusive: bool):
+        async def conversations_history(self, channel: str, cursor: str | None, limit: int, oldest: str, inclusive: bool):
             return {
                 "messages": [
                     {"ts": "1.0", "text": "Hello", "files": []}
@@ -269,15 +283,6 @@ async def test_slack_connector(monkeypatch):
 
     monkeypatch.setattr("connectors.slack.AsyncWebClient", lambda token: AsyncWebStub())
 
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
-    monkeypatch.setattr("connectors.slack.load_state", load_state)
-    monkeypatch.setattr("connectors.slack.save_state", save_state)
-
     connector = SlackConnector()
     results = []
     async for item in connector.sync():
@@ -286,7 +291,6 @@ async def test_slack_connector(monkeypatch):
     assert results[0]["document"]["source"] == "slack"
 
 
-@pytest.mark.asyncio
 async def test_notion_connector(monkeypatch):
     from core.config import settings
 
@@ -334,15 +338,7 @@ async def test_notion_connector(monkeypatch):
                 ]
             }
 
-    monkeypatch.setattr("connectors.notion.AsyncClient", lambda auth: AsyncNotionStub())
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
-    monkeypatch.setattr("connectors.notion.load_state", load_state)
-    monkeypatch.setattr("connectors.notion.save_state", save_state)
+    monkeypatch.setattr("connectors.notion.AsyncClient", lambda auth, client: AsyncNotionStub())
 
     connector = NotionConnector()
     results = []
@@ -352,7 +348,48 @@ async def test_notion_connector(monkeypatch):
     assert results[0]["document"]["source"] == "notion"
 
 
-@pytest.mark.asyncio
+async def test_notion_connector_reuses_cached_page(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "notion_internal_integration_token", "secret")
+    edited = "2024-05-01T10:00:00.000Z"
+    stale_system_from = "2024-05-01T10:05:00+00:00"
+
+    class SearchOnlyStub:
+        async def search(self, **kwargs):
+            return {"results": [{"id": "page-1", "last_edited_time": edited}], "has_more": False}
+
+        @property
+        def pages(self):
+            raise AssertionError("cached page must not be refetched")
+
+        @property
+        def blocks(self):
+            raise AssertionError("cached page blocks must not be refetched")
+
+    async def load_item(name: str, item_id: str) -> Dict[str, Any] | None:
+        document = {"doc_id": f"notion:{item_id}", "source": "notion", "system_from": stale_system_from}
+        return {"version": edited, "result": {"document": document, "block": {"block_id": f"notion:{item_id}"}}}
+
+    saved_items: List[str] = []
+
+    async def save_item(name: str, item_id: str, item: Dict[str, Any], ttl_seconds: int) -> None:
+        saved_items.append(item_id)
+
+    monkeypatch.setattr("connectors.notion.AsyncClient", lambda auth, client: SearchOnlyStub())
+    monkeypatch.setattr("connectors.notion.load_item", load_item)
+    monkeypatch.setattr("connectors.notion.save_item", save_item)
+
+    connector = NotionConnector()
+    results = [item async for item in connector.sync()]
+    assert len(results) == 1
+    document = results[0]["document"]
+    assert document["doc_id"] == "notion:page-1"
+    assert document["system_from"] != stale_system_from
+    assert datetime.fromisoformat(document["system_from"]) > datetime.fromisoformat(stale_system_from)
+    assert not saved_items
+
+
 async def test_obsidian_connector(monkeypatch, tmp_path):
     from core.config import settings
 
@@ -362,14 +399,7 @@ async def test_obsidian_connector(monkeypatch, tmp_path):
     note.write_text("# Note", encoding="utf-8")
 
     monkeypatch.setattr(settings, "obsidian_vault_path", str(vault))
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {"files": {}}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
 
-    monkeypatch.setattr("connectors.obsidian.load_state", load_state)
-    monkeypatch.setattr("connectors.obsidian.save_state", save_state)
     connector = ObsidianConnector()
 
     results = []
@@ -379,7 +409,6 @@ async def test_obsidian_connector(monkeypatch, tmp_path):
     assert results[0]["document"]["source"] == "obsidian"
 
 
-@pytest.mark.asyncio
 async def test_browser_connector(monkeypatch, tmp_path):
     chrome_db = tmp_path / "History"
     chrome_db.write_bytes(b"")
@@ -419,21 +448,12 @@ class _cursor_stub:
         return self._data
 
 
-@pytest.mark.asyncio
 async def test_local_fs_connector(monkeypatch, tmp_path):
     from core.config import settings
 
     file_path = tmp_path / "doc.txt"
     file_path.write_text("content", encoding="utf-8")
     monkeypatch.setattr(settings, "local_watch_paths", [str(tmp_path)])
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {"files": {}}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
-    monkeypatch.setattr("connectors.local_fs.load_state", load_state)
-    monkeypatch.setattr("connectors.local_fs.save_state", save_state)
 
     connector = LocalFilesystemConnector()
     results = []
@@ -442,7 +462,6 @@ async def test_local_fs_connector(monkeypatch, tmp_path):
     assert results
 
 
-@pytest.mark.asyncio
 async def test_takeout_connector(monkeypatch, tmp_path):
     from core.config import settings
 
@@ -452,14 +471,6 @@ async def test_takeout_connector(monkeypatch, tmp_path):
     sample.write_text("{}", encoding="utf-8")
 
     monkeypatch.setattr(settings, "google_takeout_path", str(takeout_dir))
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {"hashes": {}}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
-    monkeypatch.setattr("connectors.takeout.load_state", load_state)
-    monkeypatch.setattr("connectors.takeout.save_state", save_state)
 
     connector = GoogleTakeoutConnector()
     results = []
@@ -468,14 +479,7 @@ async def test_takeout_connector(monkeypatch, tmp_path):
     assert results
 
 
-@pytest.mark.asyncio
 async def test_photos_connector(monkeypatch):
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
     class MediaItemsStub:
         def list(self, pageSize: int, pageToken: str | None = None):
             class Request:
@@ -506,8 +510,6 @@ async def test_photos_connector(monkeypatch):
         path.write_bytes(b"binary")
         return str(path)
 
-    monkeypatch.setattr("connectors.photos.load_state", load_state)
-    monkeypatch.setattr("connectors.photos.save_state", save_state)
     monkeypatch.setattr(GooglePhotosConnector, "_service", stub_service)
     monkeypatch.setattr(GooglePhotosConnector, "_download_media", download_stub)
 
@@ -518,7 +520,6 @@ async def test_photos_connector(monkeypatch):
     assert results
 
 
-@pytest.mark.asyncio
 async def test_generic_imap_connector(monkeypatch):
     from core.config import settings
 
@@ -547,14 +548,6 @@ async def test_generic_imap_connector(monkeypatch):
             return None
 
     monkeypatch.setattr("connectors.imap.aioimaplib.IMAP4_SSL", lambda host, port: ClientStub())
-    async def load_state(name: str) -> Dict[str, Any]:
-        return {"last_uid": 0}
-
-    async def save_state(name: str, state: Dict[str, Any]) -> None:
-        return None
-
-    monkeypatch.setattr("connectors.imap.load_state", load_state)
-    monkeypatch.setattr("connectors.imap.save_state", save_state)
 
     connector = GenericIMAPConnector()
     results = []
@@ -0,0 +1,76 @@
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from apps.api.services.retrieval import RetrievalOrchestrator
+
+
+class FakeGraph:
+    async def bm25_search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        return [{"node": {"doc_id": "doc-1", "text_content": "Alpha details"}, "score": 0.7}]
+
+    async def entity_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        return []
+
+    async def traverse_related(self, doc_ids, limit: int = 50):
+        return []
+
+
+class FakeVectors:
+    async def search(self, table_name: str, vector: List[float], limit: int = 20, filters=None):
+        return [{"doc_id": "doc-1", "text": "Project Alpha", "score": 0.9, "uri": "minio://alpha"}]
+
+
+class FakeCache:
+    __slots__ = ("store", "_get", "_set")
+
+    def __init__(self) -> None:
+        self.store: Dict[str, Any] = {}
+        self._get = self.store.get
+        self._set = self.store.__setitem__
+
+    async def get(self, key: str):
+        return self._get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 86400):
+        self._set(key, value)
+
+
+_PROTO = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+
+
+class FakeTextEmbeddings:
+    async def embed(self, texts):
+        return np.broadcast_to(_PROTO, (len(texts), _PROTO.size)).tolist()
+
+
+class FakeReranker:
+    async def rerank(self, query: str, candidates):
+        pairs = list(candidates)
+        scores = np.full(len(pairs), 0.95, dtype=np.float32)
+        return [(doc_id, text, score) for (doc_id, text), score in zip(pairs, scores.tolist())]
+
+
+@pytest.fixture(scope="session")
+def fake_cache() -> FakeCache:
+    return FakeCache()
+
+
+@pytest.fixture(scope="session")
+def shared_orchestrator(fake_cache: FakeCache) -> RetrievalOrchestrator:
+    # Built once per session; only the cache keeps state between calls.
+    return RetrievalOrchestrator(
+        graph=FakeGraph(),
+        vectors=FakeVectors(),
+        cache=fake_cache,
+        text_embeddings=FakeTextEmbeddings(),
+        reranker=FakeReranker(),
+    )
+
+
+@pytest.fixture
+def orchestrator(shared_orchestrator: RetrievalOrchestrator, fake_cache: FakeCache) -> RetrievalOrchestrator:
+    # Empty the cache per test so cached retrievals never leak across tests or depend on their order.
+    fake_cache.store.clear()
+    return shared_orchestrator
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 
 from apps.workers.processors.document_processor import DocumentProcessor
@@ -51,7 +52,7 @@ class FakeGraph:
     async def link_audio_transcript(self, audio_id: str, transcript_id: str):
         return None
 
-    async def set_block_vector(self, block_id: str, vector: List[float]) -> None:
+    async def set_block_vectors(self, rows: List[Dict[str, Any]]) -> None:
         return None
 
     async def upsert_project(self, project_props):
@@ -77,12 +78,12 @@ class FakeVectors:
 
 class FakeTextEmbeddings:
     async def embed(self, texts):
-        return [[0.1 for _ in range(4)] for _ in texts]
+        return np.full((len(texts), 4), 0.1, dtype=np.float32).tolist()
 
 
 class FakeImageEmbeddings:
     async def embed(self, image):
-        return [0.2 for _ in range(4)]
+        return np.full(4, 0.2, dtype=np.float32).tolist()
 
 
 class FakeValkey:
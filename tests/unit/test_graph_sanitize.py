@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+from core.graph.client import _sanitize
+
+
+def test_sanitize_keeps_nulls_for_reset_fields():
+    props = _sanitize({"block_id": "b-1", "valid_to": None, "text_vector": None, "bounding_box": None})
+    assert props == {"block_id": "b-1", "valid_to": None, "text_vector": None}
+
+
+def test_sanitize_converts_values():
+    moment = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    props = _sanitize({"valid_from": moment, "meta": {"a": 1}, "tags": ("x", "y")})
+    assert props == {"valid_from": moment.isoformat(), "meta": '{"a":1}', "tags": ["x", "y"]}
@@ -0,0 +1,26 @@
+import pytest
+
+from core.vectors.lancedb_client import _build_filter, _sql_literal
+
+
+def test_sql_literal_escapes_embedded_quotes():
+    assert _sql_literal("O'Brien") == "'O''Brien'"
+    assert _sql_literal("' OR 1=1 --") == "''' OR 1=1 --'"
+
+
+def test_sql_literal_non_strings():
+    assert _sql_literal(True) == "true"
+    assert _sql_literal(False) == "false"
+    assert _sql_literal(42) == "42"
+    assert _sql_literal(0.5) == "0.5"
+
+
+def test_build_filter_joins_clauses():
+    clause = _build_filter({"source": "gmail", "valid_to": None, "version": 3})
+    assert clause == "source = 'gmail' AND valid_to IS NULL AND version = 3"
+
+
+@pytest.mark.parametrize("column", ["doc_id; DROP TABLE blocks", "1source", "source = 'x' OR 1", ""])
+def test_build_filter_rejects_invalid_columns(column):
+    with pytest.raises(ValueError):
+        _build_filter({column: "value"})
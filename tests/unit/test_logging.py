@@ -0,0 +1,26 @@
+import logging
+import queue
+
+import orjson
+
+from core.logging import DeferredFormatQueueHandler, OrjsonFormatter
+
+
+def test_queued_exception_keeps_exc_info():
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger = logging.getLogger("tests.logging.deferred")
+    logger.propagate = False
+    logger.addHandler(DeferredFormatQueueHandler(log_queue))
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Unhandled server error")
+    finally:
+        logger.handlers.clear()
+
+    record = log_queue.get_nowait()
+    assert record.exc_info is not None
+    payload = orjson.loads(OrjsonFormatter("%(name)s %(levelname)s %(message)s").format(record))
+    assert payload["message"] == "Unhandled server error"
+    assert "ValueError: boom" in payload["exc_info"]
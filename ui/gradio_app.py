@@ -1,40 +1,183 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import asyncio
+import hashlib
+import os
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
 import gradio as gr
 import httpx
+import orjson
+from cachetools import TTLCache
 
 API_BASE = "http://localhost:8000"
+_ASK_STREAM_URL = "/ask/stream"
+
+# Shared across submits so queries reuse pooled keep-alive connections to the API.
+_CLIENT = httpx.AsyncClient(
+    base_url=API_BASE,
+    timeout=httpx.Timeout(60.0, connect=5.0),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30.0),
+    http2=True,
+)
+
+Citation = Dict[str, Any]
+
+TOP_K = 5
+# Submits only wait on the API, so many can be in flight at once instead of Gradio's default of one.
+UI_CONCURRENCY = 32
+# Repeated questions within a minute are answered without another /ask round trip.
+_RESPONSES: TTLCache[Tuple[str, int, str], Dict[str, Any]] = TTLCache(maxsize=256, ttl=60)
+
+
+# Concurrent submits are coalesced and their /ask/stream requests opened together via gather.
+# With no server-side batch route the default wait is 0: drain what is already queued and add
+# no latency. UI_BATCH_WAIT_MS > 0 holds a batch open that long to collect more submits.
+UI_BATCH_SIZE = int(os.getenv("UI_BATCH_SIZE", "16"))
+UI_BATCH_WAIT_MS = int(os.getenv("UI_BATCH_WAIT_MS", "0"))
+
+_PendingAsk = Tuple[bytes, Dict[str, str], asyncio.Future[httpx.Response]]
+_QUEUE: asyncio.Queue[_PendingAsk] = asyncio.Queue()
+_DISPATCHER: asyncio.Task[None] | None = None
+_IN_FLIGHT: set[asyncio.Future[Any]] = set()
+
+
+async def _open_stream(
+    body: bytes, headers: Dict[str, str], future: asyncio.Future[httpx.Response]
+) -> None:
+    try:
+        request = _CLIENT.build_request("POST", _ASK_STREAM_URL, content=body, headers=headers)
+        response = await _CLIENT.send(request, stream=True)
+    except Exception as exc:
+        if not future.done():
+            future.set_exception(exc)
+        return
+    # The submit may have been cancelled (e.g. the tab closed) while the request was in flight.
+    if future.done():
+        await response.aclose()
+        return
+    future.set_result(response)
+
+
+async def _dispatch() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _QUEUE.get()]
+        deadline = loop.time() + UI_BATCH_WAIT_MS / 1000
+        while len(batch) < UI_BATCH_SIZE:
+            if not _QUEUE.empty():
+                batch.append(_QUEUE.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_QUEUE.get(), remaining))
+            except TimeoutError:
+                break
+        # Not awaited here, so a slow batch never holds back the next one.
+        in_flight = asyncio.gather(*(_open_stream(*item) for item in batch))
+        _IN_FLIGHT.add(in_flight)
+        in_flight.add_done_callback(_IN_FLIGHT.discard)
+
+
+async def _ask_stream(body: bytes, headers: Dict[str, str]) -> httpx.Response:
+    global _DISPATCHER
+    # Started lazily: build_app() runs before Gradio's event loop exists.
+    if _DISPATCHER is None or _DISPATCHER.done():
+        _DISPATCHER = asyncio.create_task(_dispatch())
+    future: asyncio.Future[httpx.Response] = asyncio.get_running_loop().create_future()
+    await _QUEUE.put((body, headers, future))
+    return await future
+
+
+@lru_cache(maxsize=64)
+def _auth(token: str) -> Tuple[Dict[str, str], str]:
+    # Headers and cache-key digest built once per token; the dict is shared, so never mutate it.
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers, hashlib.sha1(token.encode("utf-8")).hexdigest()[:16]
+
+
+_DEMO: gr.Blocks | None = None
 
 
 def build_app() -> gr.Blocks:
+    global _DEMO
+    # Reloads and test harnesses reuse the built tree; GRADIO_REBUILD=1 forces a fresh one.
+    if _DEMO is not None and os.getenv("GRADIO_REBUILD") != "1":
+        return _DEMO
     with gr.Blocks(title="Personal Knowledge Brain") as demo:
         gr.Markdown("# Personal Knowledge Brain\nChat with your private knowledge graph.")
         token_box = gr.Textbox(label="JWT Token", value="", type="password")
         chatbot = gr.Chatbot(label="Assistant")
         query_box = gr.Textbox(label="Ask a question")
         citations = gr.JSON(label="Citations")
+        # The complete list stays server-side until asked for, so each turn only ships the preview.
+        all_citations = gr.State([])
+        show_all = gr.Button("Show all citations")
+        full_citations = gr.JSON(label="Full citations", visible=False)
 
-        async def on_submit(query: str, history: List[Dict[str, str]], token: str):
-            headers = {"Authorization": f"Bearer {token}"} if token else {}
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{API_BASE}/ask",
-                    json={"query": query, "top_k": 5},
-                    headers=headers,
-                )
+        async def on_submit(
+            query: str, history: List[List[str]], token: str
+        ) -> AsyncIterator[Tuple[List[List[str]], List[Citation], str, List[Citation]]]:
+            normalized = query.strip()
+            if not normalized:
+                yield history, [], "", []
+                return
+            headers, token_digest = _auth(token)
+            key = (normalized.lower(), TOP_K, token_digest)
+            data = _RESPONSES.get(key)
+            if data is not None:
+                history.append([query, data["answer"]])
+                citation_list = data.get("citations") or []
+                yield history, citation_list[:TOP_K], "", citation_list
+                return
+            # The chatbot value arrives as a fresh list per event, so the turn is appended in place
+            # and filled in as tokens arrive rather than copying the whole history on every yield.
+            turn = [query, ""]
+            history.append(turn)
+            citation_list: List[Citation] = []
+            # Render tokens as the API streams them instead of waiting for the whole answer.
+            body = orjson.dumps({"query": query, "top_k": TOP_K})
+            response = await _ask_stream(body, headers)
+            try:
                 response.raise_for_status()
-                data = response.json()
-            messages = history + [[query, data["answer"]]]
-            citation_list = data.get("citations", [])
-            return messages, citation_list, ""
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    event = orjson.loads(line[len("data: "):])
+                    if "token" in event:
+                        turn[1] += event["token"]
+                        yield history, [], "", []
+                    else:
+                        citation_list = event.get("citations") or []
+            finally:
+                await response.aclose()
+            _RESPONSES[key] = {"answer": turn[1], "citations": citation_list}
+            yield history, citation_list[:TOP_K], "", citation_list
 
-        query_box.submit(fn=on_submit, inputs=[query_box, chatbot, token_box], outputs=[chatbot, citations, query_box])
+        query_box.submit(
+            fn=on_submit,
+            inputs=[query_box, chatbot, token_box],
+            outputs=[chatbot, citations, query_box, all_citations],
+            api_name="ask",
+            trigger_mode="once",
+            concurrency_limit=UI_CONCURRENCY,
+            concurrency_id="ask",
+        )
+        show_all.click(
+            fn=lambda citation_list: gr.update(value=citation_list, visible=True),
+            inputs=[all_citations],
+            outputs=[full_citations],
+        )
+    _DEMO = demo
     return demo
 
 
 if __name__ == "__main__":
     demo = build_app()
-    demo.queue()
+    demo.queue(default_concurrency_limit=UI_CONCURRENCY, max_size=256, api_open=False)
     demo.launch()